@@ -69,7 +69,8 @@ const SHORT_COMMAND_MAX_CHARS = 110;
 const MAX_SENTENCES_PER_UTTERANCE = 2;
 
 type WorkerEvent =
-	| { type: "ready"; player?: string; model?: string }
+	| { type: "ready"; player?: string; model?: string; model_loading?: boolean }
+	| { type: "model_ready"; model?: string }
 	| { type: "ack"; id: string }
 	| { type: "synth_done"; id: string; synth_ms?: number }
 	| { type: "play_done"; id: string; synth_ms?: number; play_ms?: number }
@@ -96,6 +97,8 @@ const workerPath = join(extensionDir, "kittentts_worker.py");
 export default function kittenTts(pi: ExtensionAPI) {
 	let enabled = true;
 	let available = false;
+	let modelLoading = false;
+	let workerPlayer = "audio player";
 	let currentVoice = DEFAULT_VOICE;
 	let chunkChars = INITIAL_CHUNK_CHARS;
 	let worker: ChildProcessWithoutNullStreams | null = null;
@@ -195,6 +198,10 @@ export default function kittenTts(pi: ExtensionAPI) {
 		}
 
 		const queued = pending.size;
+		if (modelLoading) {
+			setStatus(queued > 0 ? `TTS: loading model... (${queued} queued)` : "TTS: loading model...");
+			return;
+		}
 		if (queued <= 0) {
 			setStatus(`TTS: idle${latencySuffix(false)}`);
 			return;
@@ -271,10 +278,25 @@ export default function kittenTts(pi: ExtensionAPI) {
 
 	const handleWorkerEvent = (event: WorkerEvent) => {
 		if (event.type === "ready") {
-			clearReadyTimer();
 			available = true;
+			workerPlayer = event.player || "audio player";
+			if (event.model_loading) {
+				// The model is still downloading/loading; keep the ready timer armed until model_ready.
+				modelLoading = true;
+				updateStatus();
+				return;
+			}
+			clearReadyTimer();
 			updateStatus();
-			notify(`TTS ready (${event.player || "audio player"}, model: ${event.model || MODEL_REPO_ID})`, "info");
+			notify(`TTS ready (${workerPlayer}, model: ${event.model || MODEL_REPO_ID})`, "info");
+			return;
+		}
+
+		if (event.type === "model_ready") {
+			clearReadyTimer();
+			modelLoading = false;
+			updateStatus();
+			notify(`TTS ready (${workerPlayer}, model: ${event.model || MODEL_REPO_ID})`, "info");
 			return;
 		}
 
@@ -304,7 +326,9 @@ export default function kittenTts(pi: ExtensionAPI) {
 		}
 
 		if (event.type === "fatal") {
+			clearReadyTimer();
 			available = false;
+			modelLoading = false;
 			pending.clear();
 			updateStatus();
 			notify(`TTS unavailable: ${event.message || "worker failed to start"}`, "error");
@@ -339,6 +363,7 @@ export default function kittenTts(pi: ExtensionAPI) {
 	const startWorker = () => {
 		stopWorker();
 		available = false;
+		modelLoading = false;
 		workerBuffer = "";
 		pending.clear();
 		resetStats();
@@ -370,6 +395,9 @@ export default function kittenTts(pi: ExtensionAPI) {
 			return;
 		}
 
+		// Events carry raw UTF-8, so let the stream hold partial multi-byte characters across chunks.
+		worker.stdout.setEncoding("utf8");
+		worker.stderr.setEncoding("utf8");
 		worker.stdout.on("data", handleWorkerStdoutData);
 		worker.stderr.on("data", (data: Buffer | string) => {
 			const message = data.toString().trim();
@@ -396,6 +424,8 @@ export default function kittenTts(pi: ExtensionAPI) {
 		readyTimer = setTimeout(() => {
 			if (!available) {
 				notify("TTS worker did not become ready in time", "warning");
+			} else if (modelLoading) {
+				notify("TTS model is still loading (the first run downloads it); speech will start once it is ready", "warning");
 			}
 		}, WORKER_READY_TIMEOUT_MS);
 	};
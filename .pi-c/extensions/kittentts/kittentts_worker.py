@@ -10,10 +10,13 @@ Input:
   {"op":"shutdown"}
 
 Output events:
-  {"type":"ready","player":"aplay"}
+  {"type":"ready","player":"aplay","model":"...","model_loading":true}
+  {"type":"model_ready","model":"..."}
   {"type":"ack","id":"c1"}
   {"type":"synth_done","id":"c1","synth_ms":123}
   {"type":"play_done","id":"c1","synth_ms":123,"play_ms":456}
+    (long texts play as several parts; earlier parts report ids "c1.0", "c1.1", ...
+    and the final part reports "c1")
   {"type":"pause_done","id":"p1","pause_ms":350}
   {"type":"error","id":"c1","stage":"synth|play|input","message":"..."}
 """
@@ -31,6 +34,7 @@ import sys
 import tempfile
 import threading
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from typing import Optional
 
@@ -41,13 +45,44 @@ from typing import Optional
 DEFAULT_MODEL_REPO_ID = "KittenML/kitten-tts-micro-0.8"
 DEFAULT_PLAYER_PRIORITY = ("pw-play", "paplay", "aplay")
 DEFAULT_SAMPLE_RATE = 24000
+# Raw players get an explicit small buffer; their defaults hold back up to ~2 s before starting.
+PCM_PLAYER_LATENCY_MS = 200
+# Players that accept mono s16le PCM on stdin; other players are fed temp WAV files.
+RAW_PLAYER_ARGS: dict[str, tuple[str, ...]] = {
+    "paplay": (
+        "--raw",
+        "--format=s16le",
+        f"--rate={DEFAULT_SAMPLE_RATE}",
+        "--channels=1",
+        f"--latency-msec={PCM_PLAYER_LATENCY_MS}",
+    ),
+    "aplay": (
+        "-q",
+        "-t",
+        "raw",
+        "-f",
+        "S16_LE",
+        "-r",
+        str(DEFAULT_SAMPLE_RATE),
+        "-c",
+        "1",
+        f"--buffer-time={PCM_PLAYER_LATENCY_MS * 1000}",
+        f"--period-time={PCM_PLAYER_LATENCY_MS * 250}",
+        "-",
+    ),
+}
+PCM_PLAYER_LEAD_S = 0.1
+PCM_PLAYER_STDERR_LINES = 20
 DEFAULT_MAX_TEXT_CHUNK = 400
 DEFAULT_TAIL_TRIM_SAMPLES = 5000
 DEFAULT_ORT_INTRA_THREADS = max(1, min(os.cpu_count() or 1, 8))
 DEFAULT_ORT_INTER_THREADS = 1
+DEFAULT_TOKEN_CACHE_SIZE = 512
+DEFAULT_STYLE_CACHE_SIZE = 64
 
 TOKEN_RE = re.compile(r"\w+|[^\w\s]")
 SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+WORD_CHAR_RE = re.compile(r"\w")
 
 IMPORT_ERROR: Optional[Exception] = None
 try:
@@ -61,6 +96,17 @@ try:
 except Exception as exc:
     IMPORT_ERROR = exc
 
+# Optional in-process libespeak-ng binding; falls back to phonemizer's EspeakBackend.
+try:
+    from espeak_phonemizer import Phonemizer as EspeakPhonemizer
+except ImportError:
+    EspeakPhonemizer = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class TextCleaner:
     def __init__(self) -> None:
@@ -73,9 +119,15 @@ class TextCleaner:
             )
         )
         self.word_index_dictionary = {symbol: idx for idx, symbol in enumerate(symbols)}
+        # Codepoint -> token id lookup table; -1 marks characters the model does not know.
+        self._lut = np.full(max(map(ord, self.word_index_dictionary)) + 1, -1, dtype=np.int64)
+        for symbol, idx in self.word_index_dictionary.items():
+            self._lut[ord(symbol)] = idx
 
-    def __call__(self, text: str) -> list[int]:
-        return [self.word_index_dictionary[char] for char in text if char in self.word_index_dictionary]
+    def __call__(self, text: str) -> np.ndarray:
+        codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        ids = self._lut[codepoints[codepoints < self._lut.shape[0]]]
+        return ids[ids >= 0]
 
 
 def basic_english_tokenize(text: str) -> list[str]:
@@ -92,6 +144,18 @@ def ensure_punctuation(text: str) -> str:
 
 
 def chunk_text(text: str, max_len: int = DEFAULT_MAX_TEXT_CHUNK) -> list[str]:
+    # A single short, already-terminated sentence (the common case) skips the split loop but
+    # gets the same trailing comma as every other chunk, so its intonation does not change.
+    stripped = text.strip()
+    body = stripped.rstrip(".!?")
+    if (
+        len(stripped) <= max_len
+        and body != stripped
+        and WORD_CHAR_RE.search(body)
+        and not SENTENCE_SPLIT_RE.search(body)
+    ):
+        return [ensure_punctuation(body)]
+
     chunks: list[str] = []
     for sentence in SENTENCE_SPLIT_RE.split(text):
         sentence = sentence.strip()
@@ -101,18 +165,21 @@ def chunk_text(text: str, max_len: int = DEFAULT_MAX_TEXT_CHUNK) -> list[str]:
             chunks.append(ensure_punctuation(sentence))
             continue
 
-        temp_chunk = ""
+        temp_words: list[str] = []
+        temp_len = 0
         for word in sentence.split():
-            if len(temp_chunk) + len(word) + 1 <= max_len:
-                temp_chunk += f" {word}" if temp_chunk else word
+            if temp_len + len(word) + 1 <= max_len:
+                temp_len += len(word) + (1 if temp_words else 0)
+                temp_words.append(word)
                 continue
 
-            if temp_chunk:
-                chunks.append(ensure_punctuation(temp_chunk.strip()))
-            temp_chunk = word
+            if temp_words:
+                chunks.append(ensure_punctuation(" ".join(temp_words)))
+            temp_words = [word]
+            temp_len = len(word)
 
-        if temp_chunk:
-            chunks.append(ensure_punctuation(temp_chunk.strip()))
+        if temp_words:
+            chunks.append(ensure_punctuation(" ".join(temp_words)))
 
     return chunks
 
@@ -128,6 +195,33 @@ def read_env_int(name: str, fallback: int, min_value: int = 1) -> int:
     return max(min_value, value)
 
 
+def read_env_cpus(name: str) -> Optional[list[int]]:
+    raw = os.environ.get(name)
+    if not raw:
+        return None
+    cpus: set[int] = set()
+    try:
+        for part in raw.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            start, _, end = part.partition("-")
+            cpus.update(range(int(start), int(end or start) + 1))
+    except ValueError:
+        return None
+    return sorted(cpus) or None
+
+
+def set_cpu_affinity(cpus: Optional[list[int]], pid: int = 0) -> None:
+    # On Linux, pid 0 targets the calling thread only, so each worker loop can be pinned separately.
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(pid, cpus)
+    except OSError:
+        pass
+
+
 class KittenOnnxModel:
     def __init__(self, model_repo_id: str, cache_dir: Optional[str] = None) -> None:
         config_path = hf_hub_download(repo_id=model_repo_id, filename="config.json", cache_dir=cache_dir)
@@ -146,9 +240,26 @@ class KittenOnnxModel:
         self.available_voices = tuple(sorted(self.voices.keys()))
         self.text_cleaner = TextCleaner()
         self.phonemizer = self._build_phonemizer()
+        self._phonemizer_lock = threading.Lock()
+        self._token_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._token_cache_size = read_env_int("KITTENTTS_TOKEN_CACHE_SIZE", DEFAULT_TOKEN_CACHE_SIZE, min_value=0)
+        self._token_cache_lock = threading.Lock()
         self.session = self._build_session(model_path)
+        self._output_name = self.session.get_outputs()[0].name
+        self._io_binding = self.session.io_binding()
+        self._speed_ortvalue = ort.OrtValue.ortvalue_from_numpy(np.zeros(1, dtype=np.float32))
+        self._style_cache: "OrderedDict[tuple[str, int], ort.OrtValue]" = OrderedDict()
+
+    def _build_phonemizer(self) -> "EspeakPhonemizer | EspeakBackend":
+        if EspeakPhonemizer is not None:
+            # The binding loads the system libespeak-ng lazily, so probe it once here.
+            try:
+                fast_phonemizer = EspeakPhonemizer(default_voice="en-us")
+                fast_phonemizer.phonemize("a", keep_clause_breakers=True)
+                return fast_phonemizer
+            except Exception:
+                pass
 
-    def _build_phonemizer(self) -> EspeakBackend:
         EspeakWrapper.set_library(espeakng_loader.get_library_path())
         data_path = espeakng_loader.get_data_path()
         if hasattr(EspeakWrapper, "set_data_path"):
@@ -161,11 +272,31 @@ class KittenOnnxModel:
     def _build_session(self, model_path: str) -> ort.InferenceSession:
         intra_threads = read_env_int("KITTENTTS_ORT_INTRA_THREADS", DEFAULT_ORT_INTRA_THREADS)
         inter_threads = read_env_int("KITTENTTS_ORT_INTER_THREADS", DEFAULT_ORT_INTER_THREADS)
+        synth_cpus = read_env_cpus("KITTENTTS_SYNTH_CPUS")
+        if synth_cpus:
+            # More pool threads than pinned cores would just contend at the intra-op barrier.
+            intra_threads = min(intra_threads, len(synth_cpus))
 
         session_options = ort.SessionOptions()
         session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
         session_options.intra_op_num_threads = intra_threads
         session_options.inter_op_num_threads = inter_threads
+        session_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        session_options.enable_cpu_mem_arena = True
+        session_options.enable_mem_pattern = True
+        # The worker runs one chunk at a time with idle gaps in between; spinning pool
+        # threads would only burn CPU while waiting for the next Run().
+        session_options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+        session_options.add_session_config_entry("session.inter_op.allow_spinning", "0")
+
+        if synth_cpus and intra_threads > 1:
+            # One entry per pool thread (the calling thread is not part of the pool); ORT
+            # processor ids are 1-based.
+            affinities = [str(synth_cpus[(index + 1) % len(synth_cpus)] + 1) for index in range(intra_threads - 1)]
+            session_options.add_session_config_entry("session.intra_op_thread_affinities", ";".join(affinities))
+
+        if read_env_int("KITTENTTS_QUANTIZE", 0, min_value=0) > 0:
+            model_path = self._quantized_model_path(model_path)
 
         return ort.InferenceSession(
             model_path,
@@ -173,18 +304,67 @@ class KittenOnnxModel:
             providers=["CPUExecutionProvider"],
         )
 
+    def _quantized_model_path(self, model_path: str) -> str:
+        quant_path = f"{model_path}.int8.onnx"
+        if os.path.exists(quant_path):
+            return quant_path
+
+        tmp_path: Optional[str] = None
+        try:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            # A unique temp name keeps two workers starting at once from clobbering each other.
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f"{os.path.basename(quant_path)}.",
+                dir=os.path.dirname(quant_path),
+            )
+            os.close(fd)
+            quantize_dynamic(
+                model_path,
+                tmp_path,
+                weight_type=QuantType.QInt8,
+                op_types_to_quantize=["MatMul", "Gemm"],
+            )
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, quant_path)
+            return quant_path
+        except Exception as exc:
+            # Quantization is optional: a missing onnx package, a read-only cache or an already
+            # quantized graph falls back to the fp32 model instead of failing the worker.
+            if tmp_path:
+                safe_unlink(tmp_path)
+            print(f"KITTENTTS_QUANTIZE ignored, using fp32 model: {exc}", file=sys.stderr, flush=True)
+            return model_path
+
     def _load_voices(self, voices_path: str) -> dict[str, np.ndarray]:
+        voices_dir = f"{voices_path}.d"
         voices_npz = np.load(voices_path)
         voices: dict[str, np.ndarray] = {}
         try:
             for voice_name in voices_npz.files:
-                voices[voice_name] = np.asarray(voices_npz[voice_name], dtype=np.float32)
+                try:
+                    voices[voice_name] = self._map_voice(voices_npz, voice_name, voices_dir)
+                except OSError:
+                    # Read-only or shared HF_HOME: keep this voice in memory instead.
+                    voices[voice_name] = np.asarray(voices_npz[voice_name], dtype=np.float32)
         finally:
             voices_npz.close()
         if not voices:
             raise ValueError("Model voices file did not contain any voice embeddings")
         return voices
 
+    def _map_voice(self, voices_npz: "np.lib.npyio.NpzFile", voice_name: str, voices_dir: str) -> np.ndarray:
+        # npz members cannot be memory-mapped, so each voice is extracted once to a raw .npy
+        # next to the archive and mapped read-only; only the style rows in use get paged in.
+        npy_path = os.path.join(voices_dir, f"{voice_name}.npy")
+        if not os.path.exists(npy_path):
+            os.makedirs(voices_dir, exist_ok=True)
+            tmp_path = f"{npy_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.asarray(voices_npz[voice_name], dtype=np.float32))
+            os.replace(tmp_path, npy_path)
+        return np.load(npy_path, mmap_mode="r")
+
     def _resolve_voice(self, voice: str) -> str:
         resolved = self.voice_aliases.get(voice, voice)
         if resolved not in self.voices:
@@ -195,25 +375,86 @@ class KittenOnnxModel:
         prior = self.speed_priors.get(voice, 1.0)
         return float(speed) * prior
 
-    def _prepare_inputs(self, text: str, voice: str, speed: float) -> dict[str, np.ndarray]:
-        resolved_voice = self._resolve_voice(voice)
-        effective_speed = self._effective_speed(resolved_voice, speed)
-
-        phoneme_items = self.phonemizer.phonemize([text])
-        if not phoneme_items:
+    def _phonemize(self, texts: list[str]) -> list[str]:
+        # libespeak-ng keeps global state, so calls must not interleave across threads.
+        with self._phonemizer_lock:
+            if EspeakPhonemizer is not None and isinstance(self.phonemizer, EspeakPhonemizer):
+                return [self.phonemizer.phonemize(text, keep_clause_breakers=True) for text in texts]
+            phoneme_items = self.phonemizer.phonemize(texts)
+        if len(phoneme_items) != len(texts):
             raise ValueError("Phonemizer returned no output")
-        phoneme_text = " ".join(basic_english_tokenize(phoneme_items[0]))
+        return phoneme_items
+
+    def _phonemes_to_token_ids(self, phonemes: str) -> np.ndarray:
+        phoneme_text = " ".join(basic_english_tokenize(phonemes))
         tokens = self.text_cleaner(phoneme_text)
-        if not tokens:
+        if not tokens.size:
             raise ValueError("No valid tokens were produced for input text")
 
-        tokens.insert(0, 0)
-        tokens.append(0)
-        input_ids = np.array([tokens], dtype=np.int64)
+        input_ids = np.zeros((1, tokens.size + 2), dtype=np.int64)
+        input_ids[0, 1:-1] = tokens
+        # Cached arrays are shared between calls, so guard them against in-place edits.
+        input_ids.setflags(write=False)
+        return input_ids
+
+    def tokenize_chunks(self, text_chunks: list[str]) -> list[np.ndarray]:
+        token_ids: list[Optional[np.ndarray]] = [None] * len(text_chunks)
+        missing: list[int] = []
+        with self._token_cache_lock:
+            for index, text in enumerate(text_chunks):
+                cached = self._token_cache.get(text)
+                if cached is None:
+                    missing.append(index)
+                    continue
+                self._token_cache.move_to_end(text)
+                token_ids[index] = cached
+
+        if missing:
+            # One phonemizer call for every uncached chunk amortizes its per-call setup.
+            phoneme_items = self._phonemize([text_chunks[index] for index in missing])
+            for index, phonemes in zip(missing, phoneme_items):
+                token_ids[index] = self._phonemes_to_token_ids(phonemes)
+
+            if self._token_cache_size > 0:
+                with self._token_cache_lock:
+                    for index in missing:
+                        self._token_cache[text_chunks[index]] = token_ids[index]
+                        self._token_cache.move_to_end(text_chunks[index])
+                    while len(self._token_cache) > self._token_cache_size:
+                        self._token_cache.popitem(last=False)
+        return token_ids
+
+    def _style_ortvalue(self, voice: str, ref_id: int) -> ort.OrtValue:
+        key = (voice, ref_id)
+        style = self._style_cache.get(key)
+        if style is not None:
+            self._style_cache.move_to_end(key)
+            return style
+
+        voice_matrix = self.voices[voice]
+        style = ort.OrtValue.ortvalue_from_numpy(
+            np.array(voice_matrix[ref_id : ref_id + 1], dtype=np.float32, copy=True)
+        )
+        self._style_cache[key] = style
+        while len(self._style_cache) > DEFAULT_STYLE_CACHE_SIZE:
+            self._style_cache.popitem(last=False)
+        return style
+
+    def _prepare_inputs(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        input_ids: Optional[np.ndarray] = None,
+    ) -> dict[str, "np.ndarray | ort.OrtValue"]:
+        resolved_voice = self._resolve_voice(voice)
+        effective_speed = self._effective_speed(resolved_voice, speed)
+        if input_ids is None:
+            input_ids = self.tokenize_chunks([text])[0]
 
         voice_matrix = self.voices[resolved_voice]
         ref_id = min(len(text), voice_matrix.shape[0] - 1)
-        style = voice_matrix[ref_id : ref_id + 1]
+        style = self._style_ortvalue(resolved_voice, ref_id)
 
         return {
             "input_ids": input_ids,
@@ -221,26 +462,31 @@ class KittenOnnxModel:
             "speed": np.array([effective_speed], dtype=np.float32),
         }
 
-    def _generate_single_chunk(self, text: str, voice: str, speed: float) -> np.ndarray:
-        onnx_inputs = self._prepare_inputs(text, voice, speed)
-        outputs = self.session.run(None, onnx_inputs)
+    def _generate_single_chunk(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        input_ids: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        onnx_inputs = self._prepare_inputs(text, voice, speed, input_ids)
+        self._speed_ortvalue.update_inplace(onnx_inputs["speed"])
+
+        binding = self._io_binding
+        binding.bind_cpu_input("input_ids", onnx_inputs["input_ids"])
+        binding.bind_ortvalue_input("style", onnx_inputs["style"])
+        binding.bind_ortvalue_input("speed", self._speed_ortvalue)
+        binding.bind_output(self._output_name, "cpu")
+        self.session.run_with_iobinding(binding)
+        outputs = binding.get_outputs()
         if not outputs:
             raise RuntimeError("Model inference returned no outputs")
 
-        waveform = np.asarray(outputs[0], dtype=np.float32).reshape(-1)
+        waveform = np.asarray(outputs[0].numpy(), dtype=np.float32).reshape(-1)
         if waveform.shape[-1] > DEFAULT_TAIL_TRIM_SAMPLES:
             waveform = waveform[:-DEFAULT_TAIL_TRIM_SAMPLES]
         return waveform
 
-    def generate_to_file(self, text: str, output_path: str, voice: str, speed: float) -> None:
-        text_chunks = chunk_text(text)
-        if not text_chunks:
-            raise ValueError("Cannot synthesize empty text")
-
-        audio_chunks = [self._generate_single_chunk(chunk, voice, speed) for chunk in text_chunks]
-        audio = np.concatenate(audio_chunks, axis=-1).astype(np.float32, copy=False)
-        sf.write(output_path, audio, DEFAULT_SAMPLE_RATE)
-
 
 @dataclass
 class SpeakJob:
@@ -254,8 +500,11 @@ class SpeakJob:
 @dataclass
 class SynthResult:
     job: SpeakJob
-    wav_path: str
+    part_id: str
     synth_ms: int
+    pcm: Optional[np.ndarray] = None
+    wav_path: Optional[str] = None
+    final: bool = True
 
 
 @dataclass
@@ -268,14 +517,29 @@ class PauseJob:
 emit_lock = threading.Lock()
 state_lock = threading.Lock()
 active_generation = 0
-stop_event = threading.Event()
 plan_queue: "queue.Queue[Optional[SpeakJob | PauseJob]]" = queue.Queue()
 play_queue: "queue.Queue[Optional[SynthResult | PauseJob]]" = queue.Queue()
+player_lock = threading.Lock()
+current_player_proc: Optional[subprocess.Popen] = None
+
+
+def encode_event(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+
+def decode_command(line: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
 
 
 def emit(payload: dict) -> None:
+    line = encode_event(payload)
     with emit_lock:
-        print(json.dumps(payload), flush=True)
+        sys.stdout.buffer.write(line)
+        sys.stdout.buffer.flush()
 
 
 def get_generation() -> int:
@@ -308,6 +572,16 @@ def pick_player(priority: tuple[str, ...]) -> Optional[str]:
     return None
 
 
+def drain_queue(q: queue.Queue) -> None:
+    while True:
+        try:
+            item = q.get_nowait()
+        except queue.Empty:
+            return
+        if isinstance(item, SynthResult) and item.wav_path:
+            safe_unlink(item.wav_path)
+
+
 def safe_unlink(path: str) -> None:
     try:
         if os.path.exists(path):
@@ -316,13 +590,35 @@ def safe_unlink(path: str) -> None:
         pass
 
 
-def synth_loop(model: KittenOnnxModel) -> None:
-    while not stop_event.is_set():
-        try:
-            job = plan_queue.get(timeout=0.2)
-        except queue.Empty:
-            continue
+def to_pcm16(waveform: np.ndarray) -> np.ndarray:
+    return (np.clip(waveform, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def warm_up_model(model: KittenOnnxModel) -> None:
+    # The first Run() sizes ORT's memory arena and is much slower than steady state.
+    try:
+        model._generate_single_chunk("Hi.", model.available_voices[0], 1.0)
+    except Exception:
+        pass
 
+
+def synth_loop(model_repo_id: str, pcm_player: Optional[PcmPlayer]) -> None:
+    set_cpu_affinity(read_env_cpus("KITTENTTS_SYNTH_CPUS"))
+    try:
+        model = KittenOnnxModel(model_repo_id, cache_dir=os.environ.get("HF_HOME"))
+    except Exception as exc:
+        emit({"type": "fatal", "message": f"Failed to load ONNX model: {exc}"})
+        if pcm_player is not None:
+            pcm_player.close()
+        # The main thread is blocked reading stdin and the worker is useless without a model.
+        os._exit(1)
+
+    warm_up_model(model)
+    emit({"type": "model_ready", "model": model_repo_id})
+
+    stream_pcm = pcm_player is not None
+    while True:
+        job = plan_queue.get()
         if job is None:
             break
 
@@ -335,17 +631,43 @@ def synth_loop(model: KittenOnnxModel) -> None:
         if job.generation != get_generation():
             continue
 
+        synth_job(model, job, stream_pcm)
+
+
+def synth_job(model: KittenOnnxModel, job: SpeakJob, stream_pcm: bool) -> None:
+    text_chunks = chunk_text(job.text)
+    if not text_chunks:
+        emit({"type": "error", "id": job.chunk_id, "stage": "synth", "message": "Cannot synthesize empty text"})
+        return
+
+    tokenize_start = time.perf_counter()
+    try:
+        token_ids = model.tokenize_chunks(text_chunks)
+    except Exception as exc:
+        emit({"type": "error", "id": job.chunk_id, "stage": "synth", "message": str(exc)})
+        return
+    tokenize_ms = int((time.perf_counter() - tokenize_start) * 1000)
+
+    # Each text chunk is handed to the play loop as soon as it is ready, so playback of
+    # the first chunk overlaps synthesis of the rest.
+    total_synth_ms = 0
+    last_index = len(text_chunks) - 1
+    for index, (text_chunk, input_ids) in enumerate(zip(text_chunks, token_ids)):
+        if job.generation != get_generation():
+            return
+
+        pcm: Optional[np.ndarray] = None
         wav_path: Optional[str] = None
         try:
-            fd, wav_path = tempfile.mkstemp(suffix=".wav", prefix="pi-kittentts-")
-            os.close(fd)
-
             synth_start = time.perf_counter()
-            model.generate_to_file(job.text, wav_path, job.voice, job.speed)
+            waveform = model._generate_single_chunk(text_chunk, job.voice, job.speed, input_ids)
+            if stream_pcm:
+                pcm = to_pcm16(waveform)
+            else:
+                fd, wav_path = tempfile.mkstemp(suffix=".wav", prefix="pi-kittentts-")
+                os.close(fd)
+                sf.write(wav_path, waveform, DEFAULT_SAMPLE_RATE)
             synth_ms = int((time.perf_counter() - synth_start) * 1000)
-
-            emit({"type": "synth_done", "id": job.chunk_id, "synth_ms": synth_ms})
-            play_queue.put(SynthResult(job=job, wav_path=wav_path, synth_ms=synth_ms))
         except Exception as exc:
             if wav_path:
                 safe_unlink(wav_path)
@@ -357,52 +679,208 @@ def synth_loop(model: KittenOnnxModel) -> None:
                     "message": str(exc),
                 }
             )
+            return
+
+        if index == 0:
+            synth_ms += tokenize_ms
+        total_synth_ms += synth_ms
+        is_last = index == last_index
+        if is_last:
+            emit({"type": "synth_done", "id": job.chunk_id, "synth_ms": total_synth_ms})
+        part_id = job.chunk_id if is_last else f"{job.chunk_id}.{index}"
+        play_queue.put(
+            SynthResult(job=job, part_id=part_id, synth_ms=synth_ms, pcm=pcm, wav_path=wav_path, final=is_last)
+        )
 
 
-def play_file(player: str, wav_path: str) -> tuple[int, str]:
-    proc = subprocess.run(
-        [player, wav_path],
+def run_player(command: list[str]) -> tuple[int, str]:
+    global current_player_proc
+    proc = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
-        text=True,
-        check=False,
     )
-    return proc.returncode, (proc.stderr or "").strip()
+    with player_lock:
+        current_player_proc = proc
+    try:
+        _, stderr = proc.communicate()
+    finally:
+        with player_lock:
+            current_player_proc = None
+    return proc.returncode, (stderr or b"").decode("utf-8", errors="replace").strip()
+
+
+def stop_playback() -> None:
+    with player_lock:
+        proc = current_player_proc
+    if proc is not None and proc.poll() is None:
+        proc.terminate()
+
+
+def play_file(player: str, wav_path: str) -> tuple[int, str]:
+    return run_player([player, wav_path])
+
+
+def read_stderr_tail(stream, tail: "deque[str]") -> None:
+    # aplay reports every underrun on stderr; an unread pipe would eventually block the player.
+    try:
+        for raw in stream:
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                tail.append(line)
+    except (OSError, ValueError):
+        pass
 
 
-def play_loop(player: str) -> None:
-    while not stop_event.is_set():
+@dataclass
+class RawPlayerProcess:
+    proc: subprocess.Popen
+    interrupted: threading.Event
+    stderr_tail: "deque[str]"
+    stderr_reader: threading.Thread
+
+    def stderr_text(self) -> str:
+        self.stderr_reader.join(timeout=1.0)
+        return "\n".join(self.stderr_tail)
+
+
+class PcmPlayer:
+    def __init__(self, player: str) -> None:
+        self.player = player
+        self._command = [player, *RAW_PLAYER_ARGS[player]]
+        self._lock = threading.Lock()
+        self._current: Optional[RawPlayerProcess] = None
+        # perf_counter() time at which everything written so far has finished playing.
+        self._deadline = 0.0
+
+    def _ensure_proc(self) -> RawPlayerProcess:
+        if self._current is None or self._current.proc.poll() is not None:
+            # Spawned lazily on the play thread, so the player inherits the KITTENTTS_PLAY_CPUS mask
+            # and the output device is only held while a job is playing.
+            proc = subprocess.Popen(
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+            tail: deque[str] = deque(maxlen=PCM_PLAYER_STDERR_LINES)
+            reader = threading.Thread(target=read_stderr_tail, args=(proc.stderr, tail), daemon=True)
+            reader.start()
+            self._current = RawPlayerProcess(proc, threading.Event(), tail, reader)
+            self._deadline = time.perf_counter()
+        return self._current
+
+    def play(self, pcm: np.ndarray, generation: int, final: bool) -> tuple[int, str, int]:
+        with self._lock:
+            # A clear may have landed after play_loop checked the generation; never feed it stale audio.
+            if generation != get_generation():
+                return 0, "", 0
+            try:
+                current = self._ensure_proc()
+            except OSError as exc:
+                return 1, f"Failed to start {self.player}: {exc}", 0
+        duration = pcm.shape[0] / DEFAULT_SAMPLE_RATE
+        write_start = time.perf_counter()
         try:
-            item = play_queue.get(timeout=0.2)
-        except queue.Empty:
-            continue
+            current.proc.stdin.write(pcm.tobytes())
+            current.proc.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError):
+            code, stderr = self._finish(current)
+            return (1 if code in (None, 0) else code), stderr or f"{self.player} closed its input", 0
+
+        if final:
+            # The last part of a job ends the stream, so its tail is actually heard before play_done.
+            code, stderr = self._finish(current)
+            return code, stderr if code else "", int(duration * 1000)
+
+        with self._lock:
+            if self._current is current:
+                self._deadline = max(self._deadline, write_start + PCM_PLAYER_LATENCY_MS / 1000.0) + duration
+            deadline = self._deadline
+        # Return slightly before the audio runs out so the next part is written without a gap.
+        current.interrupted.wait(max(0.0, deadline - PCM_PLAYER_LEAD_S - time.perf_counter()))
+        return 0, "", int(duration * 1000)
+
+    def drain(self) -> None:
+        with self._lock:
+            current = self._current
+        if current is not None:
+            self._finish(current)
+
+    def _finish(self, current: RawPlayerProcess) -> tuple[int, str]:
+        # EOF makes the player flush its buffer and exit; close() cuts this short on clear.
+        try:
+            current.proc.stdin.close()
+        except (BrokenPipeError, OSError, ValueError):
+            pass
+        code = current.proc.wait()
+        with self._lock:
+            if self._current is current:
+                self._current = None
+        return code, current.stderr_text()
+
+    def close(self) -> None:
+        with self._lock:
+            current, self._current = self._current, None
+            self._deadline = time.perf_counter()
+        if current is None:
+            return
+        current.interrupted.set()
+        proc = current.proc
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
 
+
+def play_item(player: str, pcm_player: Optional[PcmPlayer], item: SynthResult) -> tuple[int, str, Optional[int]]:
+    if item.pcm is not None and pcm_player is not None:
+        return pcm_player.play(item.pcm, item.job.generation, item.final)
+    try:
+        code, stderr = play_file(player, item.wav_path)
+    finally:
+        safe_unlink(item.wav_path)
+    return code, stderr, None
+
+
+def play_loop(player: str, pcm_player: Optional[PcmPlayer]) -> None:
+    set_cpu_affinity(read_env_cpus("KITTENTTS_PLAY_CPUS"))
+    while True:
+        item = play_queue.get()
         if item is None:
             break
 
         if isinstance(item, PauseJob):
             if item.generation != get_generation():
                 continue
+            if pcm_player is not None:
+                pcm_player.drain()
             time.sleep(max(item.pause_ms, 0) / 1000.0)
             emit({"type": "pause_done", "id": item.chunk_id, "pause_ms": item.pause_ms})
             continue
 
         job = item.job
         if job.generation != get_generation():
-            safe_unlink(item.wav_path)
+            if item.wav_path:
+                safe_unlink(item.wav_path)
             continue
 
         play_start = time.perf_counter()
-        code, stderr = play_file(player, item.wav_path)
-        play_ms = int((time.perf_counter() - play_start) * 1000)
+        code, stderr, audio_ms = play_item(player, pcm_player, item)
+        play_ms = audio_ms if audio_ms is not None else int((time.perf_counter() - play_start) * 1000)
 
-        safe_unlink(item.wav_path)
+        if job.generation != get_generation():
+            # Playback was cut short by a clear; nothing left to report for this part.
+            continue
 
         if code != 0:
             emit(
                 {
                     "type": "error",
-                    "id": job.chunk_id,
+                    "id": item.part_id,
                     "stage": "play",
                     "message": stderr or f"{player} exited with code {code}",
                 }
@@ -412,7 +890,7 @@ def play_loop(player: str) -> None:
         emit(
             {
                 "type": "play_done",
-                "id": job.chunk_id,
+                "id": item.part_id,
                 "synth_ms": item.synth_ms,
                 "play_ms": play_ms,
             }
@@ -494,27 +972,23 @@ def main() -> int:
         )
         return 1
 
-    try:
-        model = KittenOnnxModel(args.model, cache_dir=os.environ.get("HF_HOME"))
-    except Exception as exc:
-        emit({"type": "fatal", "message": f"Failed to load ONNX model: {exc}"})
-        return 1
+    pcm_player = PcmPlayer(player) if player in RAW_PLAYER_ARGS else None
 
-    synth_thread = threading.Thread(target=synth_loop, args=(model,), daemon=True)
-    play_thread = threading.Thread(target=play_loop, args=(player,), daemon=True)
+    synth_thread = threading.Thread(target=synth_loop, args=(args.model, pcm_player), daemon=True)
+    play_thread = threading.Thread(target=play_loop, args=(player, pcm_player), daemon=True)
+    # The model loads on the synth thread; speak ops queue up in plan_queue meanwhile.
+    emit({"type": "ready", "player": player, "model": args.model, "model_loading": True})
     synth_thread.start()
     play_thread.start()
 
-    emit({"type": "ready", "player": player, "model": args.model})
-
     try:
-        for raw in sys.stdin:
+        for raw in sys.stdin.buffer:
             line = raw.strip()
             if not line:
                 continue
 
             try:
-                obj = json.loads(line)
+                obj = decode_command(line)
             except Exception as exc:
                 emit({"type": "error", "stage": "input", "message": f"Invalid JSON: {exc}"})
                 continue
@@ -540,6 +1014,11 @@ def main() -> int:
 
             if op == "clear":
                 new_generation = bump_generation()
+                drain_queue(plan_queue)
+                drain_queue(play_queue)
+                stop_playback()
+                if pcm_player is not None:
+                    pcm_player.close()
                 emit({"type": "cleared", "generation": new_generation})
                 continue
 
@@ -548,11 +1027,12 @@ def main() -> int:
 
             emit({"type": "error", "stage": "input", "message": f"Unknown op: {op}"})
     finally:
-        stop_event.set()
         plan_queue.put(None)
         play_queue.put(None)
         synth_thread.join(timeout=2.0)
         play_thread.join(timeout=2.0)
+        if pcm_player is not None:
+            pcm_player.close()
 
     return 0
 